@@ -9,7 +9,6 @@ import asyncio
 import logging
 import pprint
 import sys
-from typing import *
 
 from outleap import (
     COMMAND_PUMP,
@@ -22,26 +21,33 @@ from outleap import (
     LLViewerControlAPI,
     LLWindowAPI,
     UIPath,
+    use_uvloop,
 )
 
 
 async def client_connected(client: LEAPClient):
-    printer = pprint.PrettyPrinter(stream=sys.stderr)
+    # Sorting large dicts is the expensive part of pretty-printing, and order
+    # doesn't matter much for our purposes.
+    printer = pprint.PrettyPrinter(stream=sys.stderr, sort_dicts=False)
     # Kick off a request to get ops for each API supported by the viewer
-    # Won't wait for a response from the viewer between each send
-    api_futs: Dict[Awaitable, str] = {}
+    # Won't wait for a response from the viewer between each send, and the requests
+    # will all be written to the viewer at once.
     # COMMAND_PUMP is a special pump and refers to whatever command pump was assigned
     # to us as part of the LEAP handshake. It's different every time.
-    for api_name in (await client.command(COMMAND_PUMP, "getAPIs")).keys():
-        api_fut = client.command(COMMAND_PUMP, "getAPI", {"api": api_name})
-        api_futs[api_fut] = api_name
+    api_names = list((await client.command(COMMAND_PUMP, "getAPIs")).keys())
+    api_futs = [client.command(COMMAND_PUMP, "getAPI", {"api": api_name}) for api_name in api_names]
 
     # Wait for all of our getAPI commands to complete in parallel
-    for fut in (await asyncio.wait(api_futs.keys()))[0]:
-        # Print out which API this future even relates to
-        print("=" * 5, api_futs[fut], "=" * 5, file=sys.stderr)
+    api_output = []
+    # Don't let one failed request stop us from printing the rest.
+    api_results = await asyncio.gather(*api_futs, return_exceptions=True)
+    for api_name, api_details in zip(api_names, api_results):
+        # Print out which API these details relate to
+        api_output.append(f"{'=' * 5} {api_name} {'=' * 5}\n")
         # List supported ops for this api
-        printer.pprint(await fut)
+        api_output.append(printer.pformat(api_details) + "\n")
+    # Write it all out at once rather than doing a write per API
+    sys.stderr.write("".join(api_output))
 
     # Subscribe to StartupState events within this scope
     async with client.listen_scoped("StartupState") as listener:
@@ -114,6 +120,8 @@ async def client_connected(client: LEAPClient):
 
 def receiver_main():
     logging.basicConfig(level=logging.INFO)
+    # Use the faster uvloop event loop if it's installed
+    use_uvloop()
     loop = asyncio.new_event_loop()
 
     args = sys.argv[1:]
@@ -2,7 +2,7 @@
 import asyncio
 import sys
 
-from outleap import LEAPClient, LLViewerControlAPI
+from outleap import LEAPClient, LLViewerControlAPI, use_uvloop
 
 
 async def amain():
@@ -15,6 +15,8 @@ async def amain():
 
 
 def main():
+    # Use the faster uvloop event loop if it's installed
+    use_uvloop()
     asyncio.run(amain())
 
 
@@ -1,58 +1,167 @@
 from __future__ import annotations
 
 import abc
+import asyncio
+import copy
+import functools
+import operator
 import pathlib
 import uuid
-from typing import *
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Collection,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
 from .client import COMMAND_PUMP, PUMP_NAME_TYPE, CommandPumpToken, LEAPClient
 from .ui_elems import UI_PATH_TYPE, UIPath
 
+_WRAPPER_T = TypeVar("_WRAPPER_T", bound="LEAPAPIWrapper")
+
 
 class LEAPAPIWrapper(abc.ABC):
     """Base class for classes wrapping specific LEAP APIs"""
 
+    __slots__ = (
+        "_client",
+        "_pump_name",
+        "_command",
+        "_void_command",
+        "_void_command_many",
+        "_response_cache",
+    )
+
     PUMP_NAME: Optional[PUMP_NAME_TYPE] = None
 
     def __init__(self, client: LEAPClient, pump_name: Optional[PUMP_NAME_TYPE] = None):
         super().__init__()
         self._client = client
         self._pump_name = pump_name or self.PUMP_NAME
-        assert self._pump_name
+        if not self._pump_name:
+            raise ValueError(f"No pump name specified for {self.__class__.__name__}")
+        # Bind these once, they get called by nearly every method.
+        self._command = client.command
+        self._void_command = client.void_command
+        self._void_command_many = client.void_command_many
+        # Responses to requests whose results can't change during a session
+        self._response_cache: Dict[Hashable, asyncio.Future] = {}
+
+    @classmethod
+    def for_client(cls: Type[_WRAPPER_T], client: LEAPClient) -> _WRAPPER_T:
+        """Get the shared instance of this wrapper for `client`, using the default pump name"""
+        return client.api(cls)
+
+    def _cached_command(self, op: str, data: Optional[Dict] = None, cache_key: Hashable = None) -> Awaitable:
+        """
+        Like `command()`, but only makes the request once, sharing its response with later callers
+
+        Only for use with requests whose responses are static for the session. Failed requests
+        aren't cached. `cache_key` distinguishes requests using the same `op`.
+        Each caller gets its own copy of the response, so it's free to mutate it.
+        """
+        key = (op, cache_key)
+        try:
+            fut = self._response_cache.get(key)
+        except TypeError:
+            # Can't share requests with unhashable keys
+            return self._command(self._pump_name, op, data)
+        if fut is None:
+            fut = self._response_cache[key] = self._command(self._pump_name, op, data)
+
+            def _evict_failed(done_fut: asyncio.Future):
+                if done_fut.cancelled() or done_fut.exception() is not None:
+                    if self._response_cache.get(key) is done_fut:
+                        del self._response_cache[key]
+
+            fut.add_done_callback(_evict_failed)
+        # Hand out a copy so that one caller mutating the response can't corrupt it for everyone else.
+        # Cancelling the copy doesn't cancel the shared request, either.
+        return _chain_future(fut, copy.deepcopy)
+
+    def clear_cache(self) -> None:
+        """Forget any cached responses, forcing them to be re-requested"""
+        self._response_cache.clear()
+
+
+def _chain_future(src_fut: asyncio.Future, transform: Callable[[Any], Any]) -> asyncio.Future:
+    """Return a new `Future` that resolves to `transform()` applied to the result of `src_fut`"""
+    chained_fut = asyncio.Future()
+
+    def _resolve(fut: asyncio.Future) -> None:
+        if chained_fut.done():
+            return
+        if fut.cancelled():
+            chained_fut.cancel()
+        elif (exc := fut.exception()) is not None:
+            chained_fut.set_exception(exc)
+        else:
+            try:
+                val = transform(fut.result())
+            except Exception as e:
+                chained_fut.set_exception(e)
+            else:
+                chained_fut.set_result(val)
+
+    src_fut.add_done_callback(_resolve)
+    return chained_fut
 
 
-async def _data_unwrapper(data_fut: Awaitable[Dict], inner_elem: str) -> Any:
+def _data_unwrapper(data_fut: asyncio.Future, inner_elem: str) -> asyncio.Future:
     """Unwraps part of the data future while allowing the request itself to remain synchronous"""
     # We want the request to be sent immediately, without requiring the request to be `await`ed first,
-    # but that means that we have to return a `Coroutine` that will pull the value out of the dict
-    # rather than directly returning the `Future`.
-    return (await data_fut)[inner_elem]
+    # so we chain a new `Future` off of the request's `Future` that will get the value out of the dict.
+    # This is cheaper than wrapping the request in a coroutine just to do the lookup.
+    unwrapped_fut = _chain_future(data_fut, operator.itemgetter(inner_elem))
+
+    def _cancel_request(fut: asyncio.Future) -> None:
+        # Nobody's waiting on the reply anymore, don't leave the request hanging around.
+        if fut.cancelled():
+            data_fut.cancel()
+
+    unwrapped_fut.add_done_callback(_cancel_request)
+    return unwrapped_fut
 
 
 class CommandAPI(LEAPAPIWrapper):
+    __slots__ = ()
     PUMP_NAME = COMMAND_PUMP
 
     def get_apis(self) -> Awaitable[dict]:
         """
         Get a list of all available LLEventAPI instances
 
-        Returns a dict of API name -> API details
+        Returns a dict of API name -> API details. The response is cached for the session.
         """
-        return self._client.command(self._pump_name, "getAPIs")
+        return self._cached_command("getAPIs")
 
     def get_api(self, api_name: str) -> Awaitable[dict]:
-        """Get details about a specific LLEventAPI instance, including supported methos"""
-        return self._client.command(self._pump_name, "getAPI", {"api": api_name})
+        """
+        Get details about a specific LLEventAPI instance, including supported methods
+
+        The response is cached for the session.
+        """
+        return self._cached_command("getAPI", {"api": api_name}, cache_key=api_name)
 
     def ping(self) -> Awaitable[None]:
         """Send a ping and await the pong"""
-        return self._client.command(self._pump_name, "ping")
+        return self._command(self._pump_name, "ping")
 
     def start_listening(self, listener_name: str, source_pump: PUMP_NAME_TYPE) -> Awaitable[bool]:
         """Start listening on a specific pump, using `listener_name`"""
         if isinstance(source_pump, CommandPumpToken):
             source_pump = self._client.cmd_pump
-        fut = self._client.command(
+        fut = self._command(
             self._pump_name,
             "listen",
             {
@@ -66,7 +175,7 @@ class CommandAPI(LEAPAPIWrapper):
         """Stop `listener_name` from listening on a specific pump"""
         if isinstance(source_pump, CommandPumpToken):
             source_pump = self._client.cmd_pump
-        fut = self._client.command(
+        fut = self._command(
             self._pump_name,
             "stoplistening",
             {
@@ -78,6 +187,7 @@ class CommandAPI(LEAPAPIWrapper):
 
 
 class LLWindowAPI(LEAPAPIWrapper):
+    __slots__ = ("_pending_move", "_move_flush_handle")
     PUMP_NAME = "LLWindow"
 
     MASK_TYPE = Optional[Collection[str]]
@@ -86,6 +196,12 @@ class LLWindowAPI(LEAPAPIWrapper):
     CHAR_TYPE = Optional[str]
     MOUSE_COORD_TYPE: Optional[int]
 
+    def __init__(self, client: LEAPClient, pump_name: Optional[PUMP_NAME_TYPE] = None):
+        super().__init__(client, pump_name)
+        # Latest move requested through `mouse_move_coalesced()` that hasn't been sent yet
+        self._pending_move: Optional[Dict] = None
+        self._move_flush_handle: Optional[asyncio.Handle] = None
+
     def _convert_key_payload(
         self,
         /,
@@ -124,7 +240,7 @@ class LLWindowAPI(LEAPAPIWrapper):
     ) -> None:
         """Simulate a key being pressed down"""
         payload = self._convert_key_payload(keysym=keysym, keycode=keycode, char=char, mask=mask, path=path)
-        self._client.void_command(self._pump_name, "keyDown", payload)
+        self._void_command(self._pump_name, "keyDown", payload)
 
     def key_up(
         self,
@@ -138,7 +254,7 @@ class LLWindowAPI(LEAPAPIWrapper):
     ) -> None:
         """Simulate a key being released"""
         payload = self._convert_key_payload(keysym=keysym, keycode=keycode, char=char, mask=mask, path=path)
-        self._client.void_command(self._pump_name, "keyUp", payload)
+        self._void_command(self._pump_name, "keyUp", payload)
 
     def key_press(
         self,
@@ -151,28 +267,41 @@ class LLWindowAPI(LEAPAPIWrapper):
         path: UI_PATH_TYPE = None,
     ) -> None:
         """Simulate a key being pressed down and immediately released"""
-        self.key_down(mask=mask, keycode=keycode, keysym=keysym, char=char, path=path)
-        self.key_up(mask=mask, keycode=keycode, keysym=keysym, char=char, path=path)
+        # Both events use the same payload, so we only need to build it once.
+        payload = self._convert_key_payload(keysym=keysym, keycode=keycode, char=char, mask=mask, path=path)
+        self._void_command_many(self._pump_name, [("keyDown", payload), ("keyUp", payload)])
 
     def text_input(self, text_input: str, path: UI_PATH_TYPE = None) -> None:
         """Simulate a user typing a string of text"""
         # TODO: Uhhhhh I can't see how the key* APIs could possibly handle i18n correctly,
         #  what with all the U8s. Maybe I'm just dumb?
-        for char in text_input:
-            self.key_press(char=char, path=path)
+        # We know we're only ever sending `char`s without a mask, so build the payloads directly
+        # rather than going through `_convert_key_payload()` for every character.
+        commands = []
+        if path:
+            path_str = str(path)
+            for char in text_input:
+                payload = {"char": char, "path": path_str}
+                commands.extend((("keyDown", payload), ("keyUp", payload)))
+        else:
+            for char in text_input:
+                payload = {"char": char}
+                commands.extend((("keyDown", payload), ("keyUp", payload)))
+        # Send all the key events in one go rather than doing a write per event
+        self._void_command_many(self._pump_name, commands)
 
     async def get_paths(self, under: Optional[UI_PATH_TYPE] = None) -> List[UIPath]:
         """Get all UI paths under the root, or under a path if specified"""
         if not under:
             under = ""
-        resp = await self._client.command(self._pump_name, "getPaths", {"under": str(under)})
+        resp = await self._command(self._pump_name, "getPaths", {"under": str(under)})
         if error := resp.get("error"):
             raise ValueError(error)
-        return [UIPath(path) for path in resp.get("paths", [])]
+        return [UIPath(path) for path in resp.get("paths", ())]
 
-    async def get_info(self, path: UI_PATH_TYPE) -> Dict:
+    def get_info(self, path: UI_PATH_TYPE) -> Awaitable[Dict]:
         """Get info about an element specified by path"""
-        return await self._client.command(self._pump_name, "getInfo", {"path": str(path)})
+        return self._command(self._pump_name, "getInfo", {"path": str(path)})
 
     def _build_mouse_payload(
         self,
@@ -210,7 +339,8 @@ class LLWindowAPI(LEAPAPIWrapper):
     ) -> Awaitable[Dict]:
         """Simulate a mouse down event occurring at a coordinate or UI element path"""
         payload = self._build_mouse_payload(x=x, y=y, path=path, mask=mask, button=button)
-        return self._client.command(self._pump_name, "mouseDown", payload)
+        self.flush_moves()
+        return self._command(self._pump_name, "mouseDown", payload)
 
     def mouse_up(
         self,
@@ -224,7 +354,8 @@ class LLWindowAPI(LEAPAPIWrapper):
     ) -> Awaitable[Dict]:
         """Simulate a mouse up event occurring at a coordinate or UI element path"""
         payload = self._build_mouse_payload(x=x, y=y, path=path, mask=mask, button=button)
-        return self._client.command(self._pump_name, "mouseUp", payload)
+        self.flush_moves()
+        return self._command(self._pump_name, "mouseUp", payload)
 
     def mouse_click(
         self,
@@ -237,28 +368,53 @@ class LLWindowAPI(LEAPAPIWrapper):
         button: str,
     ) -> Awaitable[Dict]:
         """Simulate a mouse down and immediately following mouse up event"""
-        # We're going to ignore the mouseDown response, so use void_command instead.
-        # Most side effects are actually executed on mouseUp.
-        self._client.void_command(
-            self._pump_name,
-            "mouseDown",
-            self._build_mouse_payload(x=x, y=y, path=path, mask=mask, button=button),
-        )
-        return self.mouse_up(x=x, y=y, path=path, mask=mask, button=button)
+        payload = self._build_mouse_payload(x=x, y=y, path=path, mask=mask, button=button)
+        self.flush_moves()
+        # Send both events in the same write.
+        with self._client.batch():
+            # We're going to ignore the mouseDown response, so use void_command instead.
+            # Most side effects are actually executed on mouseUp.
+            self._void_command(self._pump_name, "mouseDown", payload)
+            return self._command(self._pump_name, "mouseUp", payload)
 
     def mouse_move(
         self, /, *, x: MOUSE_COORD_TYPE = None, y: MOUSE_COORD_TYPE = None, path: UI_PATH_TYPE = None
     ) -> Awaitable[Dict]:
         """Move the mouse to the coordinates or path specified"""
         payload = self._build_mouse_payload(x=x, y=y, path=path, mask=None)
-        return self._client.command(self._pump_name, "mouseMove", payload)
+        self.flush_moves()
+        return self._command(self._pump_name, "mouseMove", payload)
+
+    def mouse_move_coalesced(
+        self, /, *, x: MOUSE_COORD_TYPE = None, y: MOUSE_COORD_TYPE = None, path: UI_PATH_TYPE = None
+    ) -> None:
+        """
+        Like `mouse_move()`, but only the latest move made during this tick of the event loop is sent
+
+        Useful for things like drags where intermediate positions don't matter.
+        Any other mouse event will send the pending move before it.
+        """
+        self._pending_move = self._build_mouse_payload(x=x, y=y, path=path, mask=None)
+        if not self._move_flush_handle:
+            self._move_flush_handle = asyncio.get_running_loop().call_soon(self.flush_moves)
+
+    def flush_moves(self) -> None:
+        """Immediately send any move queued by `mouse_move_coalesced()`"""
+        if self._move_flush_handle:
+            self._move_flush_handle.cancel()
+            self._move_flush_handle = None
+        payload, self._pending_move = self._pending_move, None
+        if payload is not None and self._client.connected:
+            self._void_command(self._pump_name, "mouseMove", payload)
 
     def mouse_scroll(self, clicks: int) -> None:
         """Act as if the scroll wheel has been moved `clicks` amount. May be negative"""
-        self._client.command(self._pump_name, "mouseScroll", {"clicks": clicks})
+        self.flush_moves()
+        self._command(self._pump_name, "mouseScroll", {"clicks": clicks})
 
 
 class LLUIAPI(LEAPAPIWrapper):
+    __slots__ = ()
     PUMP_NAME = "UI"
 
     def call(self, function: str, parameter: Any = None) -> None:
@@ -267,15 +423,16 @@ class LLUIAPI(LEAPAPIWrapper):
 
         Can call most things registered through `LLUICtrl::CommitCallbackRegistry`.
         """
-        self._client.void_command(self._pump_name, "call", {"function": function, "parameter": parameter})
+        self._void_command(self._pump_name, "call", {"function": function, "parameter": parameter})
 
     def get_value(self, path: UI_PATH_TYPE) -> Awaitable[Any]:
         """For the UI control identified by `path`, return the current value in `value`"""
-        resp_fut = self._client.command(self._pump_name, "getValue", {"path": str(path)})
+        resp_fut = self._command(self._pump_name, "getValue", {"path": str(path)})
         return _data_unwrapper(resp_fut, "value")
 
 
 class LLCommandDispatcherAPI(LEAPAPIWrapper):
+    __slots__ = ()
     PUMP_NAME = "LLCommandDispatcher"
 
     def dispatch(
@@ -288,23 +445,28 @@ class LLCommandDispatcherAPI(LEAPAPIWrapper):
         trusted: bool = True,
     ) -> None:
         """Execute a command registered as an LLCommandHandler"""
-        return self._client.void_command(
+        return self._void_command(
             self._pump_name,
             "dispatch",
             {
                 "cmd": cmd,
-                "params": params or [],
+                "params": params or (),
                 "query": query or {},
                 "trusted": trusted,
             },
         )
 
     def enumerate(self) -> Awaitable[Dict]:
-        """Get map of registered LLCommandHandlers, containing name, key, and (e.g.) untrusted flag"""
-        return self._client.command(self._pump_name, "enumerate")
+        """
+        Get map of registered LLCommandHandlers, containing name, key, and (e.g.) untrusted flag
+
+        The response is cached for the session.
+        """
+        return self._cached_command("enumerate")
 
 
 class LLViewerControlAPI(LEAPAPIWrapper):
+    __slots__ = ()
     PUMP_NAME = "LLViewerControl"
 
     def get(self, group: str, key: str) -> Awaitable[Any]:
@@ -313,11 +475,11 @@ class LLViewerControlAPI(LEAPAPIWrapper):
 
         `group` can be one of "CrashSettings", "Global", "PerAccount", "Warnings".
         """
-        return self._client.command(self._pump_name, "get", {"key": key, "group": group})
+        return self._command(self._pump_name, "get", {"key": key, "group": group})
 
     def vars(self, group: str) -> Awaitable[List[Dict]]:
         """Return a list of dicts of controls in `group`"""
-        resp_fut = self._client.command(self._pump_name, "vars", {"group": group})
+        resp_fut = self._command(self._pump_name, "vars", {"group": group})
         return _data_unwrapper(resp_fut, "vars")
 
     def set(self, group: str, key: str, value: Any) -> None:
@@ -326,10 +488,11 @@ class LLViewerControlAPI(LEAPAPIWrapper):
 
         TODO: error handling based on "error" field in resp?
         """
-        self._client.void_command(self._pump_name, "set", {"key": key, "group": group, "value": value})
+        self._void_command(self._pump_name, "set", {"key": key, "group": group, "value": value})
 
 
 class LLViewerWindowAPI(LEAPAPIWrapper):
+    __slots__ = ()
     PUMP_NAME = "LLViewerWindow"
 
     def save_snapshot(
@@ -350,7 +513,7 @@ class LLViewerWindowAPI(LEAPAPIWrapper):
             extras["width"] = width
         if height is not None:
             extras["height"] = height
-        fut = self._client.command(
+        fut = self._command(
             self._pump_name,
             "saveSnapshot",
             {
@@ -366,12 +529,26 @@ class LLViewerWindowAPI(LEAPAPIWrapper):
 
     def request_reshape(self, width: int, height: int) -> None:
         """Request the window be resized to the specified dimensions"""
-        self._client.void_command(self._pump_name, "requestReshape", {"w": width, "h": height})
+        self._void_command(self._pump_name, "requestReshape", {"w": width, "h": height})
 
 
 class LLAgentAPI(LEAPAPIWrapper):
+    __slots__ = ()
     PUMP_NAME = "LLAgent"
 
+    def _build_look_at_payload(
+        self, obj_uuid: Optional[uuid.UUID], position: Optional[Sequence[float]], lookat_type: int
+    ) -> Dict:
+        payload = {"type": lookat_type}
+        if obj_uuid:
+            payload["obj_uuid"] = obj_uuid
+        elif position:
+            # Don't bother copying if we were already given a list
+            payload["position"] = position if isinstance(position, list) else list(position)
+        else:
+            raise ValueError("Must specify either obj_uuid or position")
+        return payload
+
     def look_at(
         self,
         /,
@@ -381,26 +558,28 @@ class LLAgentAPI(LEAPAPIWrapper):
         lookat_type: int = 8,
     ):
         """Look at either a specific `obj_uuid` or the closest object to `position`"""
-        payload = {"type": lookat_type}
-        if obj_uuid:
-            payload["obj_uuid"] = obj_uuid
-        elif position:
-            payload["position"] = list(position)
-        else:
-            raise ValueError("Must specify either obj_uuid or position")
-        self._client.void_command(self._pump_name, "lookAt", payload)
+        payload = self._build_look_at_payload(obj_uuid, position, lookat_type)
+        self._void_command(self._pump_name, "lookAt", payload)
+
+    def look_at_many(self, positions: Iterable[Sequence[float]], /, *, lookat_type: int = 8):
+        """Look at the closest object to each of `positions` in turn, sending all the requests at once"""
+        self._void_command_many(
+            self._pump_name,
+            [("lookAt", self._build_look_at_payload(None, position, lookat_type)) for position in positions],
+        )
 
     def get_auto_pilot(self) -> Awaitable[Dict]:
         """Get information about current state of the autopilot system"""
-        return self._client.command(self._pump_name, "getAutoPilot", {})
+        return self._command(self._pump_name, "getAutoPilot", {})
 
 
 class LLFloaterRegAPI(LEAPAPIWrapper):
+    __slots__ = ()
     PUMP_NAME = "LLFloaterReg"
 
     def get_build_map(self) -> Awaitable[Dict]:
-        """Get a map of floater names and their XUI xml files"""
-        return self._client.command(self._pump_name, "getBuildMap", {})
+        """Get a map of floater names and their XUI xml files, cached for the session"""
+        return self._cached_command("getBuildMap", {})
 
     def show_instance(self, name: str, key: Any = None, focus: bool = False) -> None:
         """
@@ -409,7 +588,7 @@ class LLFloaterRegAPI(LEAPAPIWrapper):
         `key` may contain specific data to bootstrap creating the floater, for
         example an item ID.
         """
-        self._client.void_command(
+        self._void_command(
             self._pump_name,
             "showInstance",
             {
@@ -421,7 +600,7 @@ class LLFloaterRegAPI(LEAPAPIWrapper):
 
     def hide_instance(self, name: str, key: Any = None) -> None:
         """Hide an instance of a floater"""
-        self._client.void_command(
+        self._void_command(
             self._pump_name,
             "hideInstance",
             {
@@ -432,7 +611,7 @@ class LLFloaterRegAPI(LEAPAPIWrapper):
 
     def toggle_instance(self, name: str, key: Any = None) -> None:
         """Toggle visibility of an instance of a floater"""
-        self._client.void_command(
+        self._void_command(
             self._pump_name,
             "toggleInstance",
             {
@@ -443,7 +622,7 @@ class LLFloaterRegAPI(LEAPAPIWrapper):
 
     def is_instance_visible(self, name: str, key: Any = None) -> Awaitable[bool]:
         """Return whether an instance was visible"""
-        fut = self._client.command(
+        fut = self._command(
             self._pump_name,
             "instanceVisible",
             {
@@ -455,7 +634,7 @@ class LLFloaterRegAPI(LEAPAPIWrapper):
 
     def click_button(self, name: str, button: str, key: Any = None) -> Awaitable[Dict]:
         """Click a button on an instance of a floater, potentially returning failure details"""
-        return self._client.command(
+        return self._command(
             self._pump_name,
             "clickButton",
             {
@@ -467,30 +646,33 @@ class LLFloaterRegAPI(LEAPAPIWrapper):
 
 
 class LLURLDispatcher(LEAPAPIWrapper):
+    __slots__ = ()
     PUMP_NAME = "LLUrlDispatcher"
 
     def dispatch(self, url: str, trusted: bool = True):
         """At startup time or on clicks in internal web browsers, teleport, open map, or run requested command."""
-        self._client.void_command(self._pump_name, "dispatch", {"url": url, "trusted": trusted})
+        self._void_command(self._pump_name, "dispatch", {"url": url, "trusted": trusted})
 
     def dispatch_right_click(self, url: str):
         """Dispatch ["url"] as if from a right-click on a hot link."""
-        self._client.void_command(self._pump_name, "dispatchRightClick", {"url": url})
+        self._void_command(self._pump_name, "dispatchRightClick", {"url": url})
 
     def dispatch_from_text_editor(self, url: str):
         """Dispatch ["url"] as if from an edit field"""
-        self._client.void_command(self._pump_name, "dispatchFromTextEditor", {"url": url})
+        self._void_command(self._pump_name, "dispatchFromTextEditor", {"url": url})
 
 
 class LLFloaterAbout(LEAPAPIWrapper):
+    __slots__ = ()
     PUMP_NAME = "LLFloaterAbout"
 
     def get_info(self) -> Awaitable[dict]:
         """Request an LLSD::Map containing information used to populate About box"""
-        return self._client.command(self._pump_name, "getInfo")
+        return self._command(self._pump_name, "getInfo")
 
 
 class LLGesture(LEAPAPIWrapper):
+    __slots__ = ()
     PUMP_NAME = "LLGesture"
 
     def get_active_gestures(self) -> Awaitable[list]:
@@ -502,40 +684,42 @@ class LLGesture(LEAPAPIWrapper):
         ["trigger"]: trigger string used to invoke via user chat, may be empty
         ["playing"]: true or false indicating the playing state
         """
-        fut = self._client.command(self._pump_name, "getActiveGestures")
+        fut = self._command(self._pump_name, "getActiveGestures")
         return _data_unwrapper(fut, "gestures")
 
     def is_gesture_playing(self, gesture_id: uuid.UUID) -> Awaitable[bool]:
-        fut = self._client.command(self._pump_name, "isGesturePlaying", {"id": gesture_id})
+        fut = self._command(self._pump_name, "isGesturePlaying", {"id": gesture_id})
         return _data_unwrapper(fut, "playing")
 
     def start_gesture(self, gesture_id: uuid):
-        self._client.void_command(self._pump_name, "startGesture", {"id": gesture_id})
+        self._void_command(self._pump_name, "startGesture", {"id": gesture_id})
 
     def stop_gesture(self, gesture_id: uuid):
-        self._client.void_command(self._pump_name, "stopGesture", {"id": gesture_id})
+        self._void_command(self._pump_name, "stopGesture", {"id": gesture_id})
 
 
 class GroupChat(LEAPAPIWrapper):
+    __slots__ = ()
     PUMP_NAME = "GroupChat"
 
     def start_im(self, group_id: uuid.UUID) -> Awaitable[uuid.UUID]:
         """Start an IM session for the specified group, returning the session ID"""
-        fut = self._client.command(self._pump_name, "startIM", {"id": group_id})
+        fut = self._command(self._pump_name, "startIM", {"id": group_id})
         return _data_unwrapper(fut, "session_id")
 
     def end_im(self, group_id: uuid.UUID):
         """End an IM session with the specified group"""
-        self._client.void_command(self._pump_name, "endIM", {"id": group_id})
+        self._void_command(self._pump_name, "endIM", {"id": group_id})
 
     def send_im(self, group_id: uuid.UUID, session_id: uuid.UUID, text: str):
         """Send an IM to the specified group with the specified chatterbox session ID"""
-        self._client.void_command(
+        self._void_command(
             self._pump_name, "sendIM", {"id": group_id, "session_id": session_id, "text": text}
         )
 
 
 class LLFloaterIMNearbyChat(LEAPAPIWrapper):
+    __slots__ = ()
     PUMP_NAME = "LLChatBar"
 
     def send_chat(self, message: str, channel: int = 0, chat_type: str = "normal"):
@@ -546,34 +730,41 @@ class LLFloaterIMNearbyChat(LEAPAPIWrapper):
         :param channel: chat channel number [default = 0]
         :param chat_type: "whisper", "normal", "shout" [default = "normal"]
         """
-        self._client.void_command(
+        self._void_command(
             self._pump_name, "sendChat", {"message": message, "channel": channel, "chat_type": chat_type}
         )
 
 
 class LLAppViewer(LEAPAPIWrapper):
+    __slots__ = ()
     PUMP_NAME = "LLAppViewer"
 
     def request_quit(self):
-        self._client.void_command(self._pump_name, "requestQuit")
+        self._void_command(self._pump_name, "requestQuit")
 
     def force_quit(self):
-        self._client.void_command(self._pump_name, "forceQuit")
+        self._void_command(self._pump_name, "forceQuit")
 
 
 class LLPuppetryAPI(LEAPAPIWrapper):
+    __slots__ = ("_send_move",)
     PUMP_NAME = "puppetry"
     OP_KEY: str = "command"
 
+    def __init__(self, client: LEAPClient, pump_name: Optional[PUMP_NAME_TYPE] = None):
+        super().__init__(client, pump_name)
+        # `move()` gets called every frame, so bind everything but the payload up front.
+        self._send_move = functools.partial(self._void_command, self._pump_name, "move", op_key=self.OP_KEY)
+
     def get_camera(self) -> Awaitable[int]:
         """Request camera number: returns ["camera_id"]"""
-        fut = self._client.command(self._pump_name, "get_camera", {}, op_key=self.OP_KEY)
+        fut = self._command(self._pump_name, "get_camera", {}, op_key=self.OP_KEY)
         return _data_unwrapper(fut, "camera_id")
 
     def set_camera(self, camera_id: int) -> None:
         """Request camera number: returns ["camera_id"]"""
         payload = {"camera_id": camera_id}
-        self._client.void_command(self._pump_name, "set_camera", payload, op_key=self.OP_KEY)
+        self._void_command(self._pump_name, "set_camera", payload, op_key=self.OP_KEY)
 
     def send_skeleton(self) -> None:
         """
@@ -581,7 +772,7 @@ class LLPuppetryAPI(LEAPAPIWrapper):
 
         Response will be sent over the "puppetry.command" listener as a "set_skeleton"
         """
-        self._client.void_command(self._pump_name, "send_skeleton", {}, op_key=self.OP_KEY)
+        self._void_command(self._pump_name, "send_skeleton", {}, op_key=self.OP_KEY)
 
     def move(self, joint_data: Dict[str, Dict]) -> None:
         """
@@ -594,7 +785,7 @@ class LLPuppetryAPI(LEAPAPIWrapper):
             param_name = rot | pos | scale | eff
             param value = array of 3 floats [x,y,z]
         """
-        self._client.void_command(self._pump_name, "move", joint_data, op_key=self.OP_KEY)
+        self._send_move(joint_data)
 
 
 __all__ = [
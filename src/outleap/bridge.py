@@ -7,7 +7,7 @@ from __future__ import annotations
 import asyncio
 import logging
 import weakref
-from typing import *
+from typing import Any, Awaitable, Callable, Optional
 
 from .client import LEAPClient
 from .protocol import LEAPProtocol
@@ -22,7 +22,7 @@ class LEAPBridgeServer:
 
     async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
         client = LEAPClient(LEAPProtocol(reader, writer))
-        logging.info("Accepting LEAP connection from %r" % (writer.get_extra_info("peername", None),))
+        logging.info("Accepting LEAP connection from %r", writer.get_extra_info("peername", None))
         await client.connect()
 
         self.clients.add(client)
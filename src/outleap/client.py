@@ -2,14 +2,32 @@ from __future__ import annotations
 
 import asyncio
 import collections
+import contextlib
 import dataclasses
 import enum
+import functools
 import logging
 import os
 import sys
 import uuid
 from types import TracebackType
-from typing import *
+from typing import (
+    Any,
+    AsyncContextManager,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
 from .protocol import AbstractLEAPProtocol, LEAPProtocol
 from .utils import connect_stdin_stdout
@@ -23,6 +41,8 @@ COMMAND_PUMP = CommandPumpToken()
 
 PUMP_NAME_TYPE = Union[CommandPumpToken, str]
 
+_API_WRAPPER_T = TypeVar("_API_WRAPPER_T")
+
 
 class LEAPClient:
     """Client for script -> viewer communication over the LEAP protocol"""
@@ -40,10 +60,18 @@ class LEAPClient:
         # the --leap arguments and those launched as puppetry plugins.
         self.launch_args: Optional[List[str]] = None
         # Map of req id -> future held by requester to send responses to
-        self._reply_futs: Dict[uuid.UUID, asyncio.Future] = {}
+        self._reply_futs: Dict[int, asyncio.Future] = {}
+        # The viewer only echoes reqids back, they just need to be unique per client.
+        self._next_reqid = 0
         self._pump_listeners: Dict[str, ListenerDetails] = collections.defaultdict(ListenerDetails)
+        # Reverse mapping of listener -> the pump it's listening to
+        self._listener_pumps: Dict[LEAPListener, str] = {}
         self._connection_status = ConnectionStatus.READY
         self._msg_pump_task: Optional[asyncio.Task] = None
+        # Shared API wrapper instances handed out by `api()`
+        self._api_wrappers: Dict[Type, Any] = {}
+        # Messages waiting to be sent at the end of a `batch()`, by the task that opened the batch
+        self._batched_messages: Dict[Optional[asyncio.Task], List[Tuple[str, Any]]] = {}
         self.shutdown_event = asyncio.Event()
 
     @classmethod
@@ -63,6 +91,17 @@ class LEAPClient:
         # Disconnect if we weren't already disconnected.
         self.disconnect()
 
+    def api(self, api_cls: Type[_API_WRAPPER_T]) -> _API_WRAPPER_T:
+        """
+        Get a shared instance of the API wrapper class `api_cls` for this client
+
+        Cheaper than constructing a new wrapper every time one's needed.
+        """
+        wrapper = self._api_wrappers.get(api_cls)
+        if wrapper is None:
+            wrapper = self._api_wrappers[api_cls] = api_cls(self)
+        return wrapper
+
     @property
     def connected(self) -> bool:
         return self._connection_status == ConnectionStatus.CONNECTED
@@ -129,22 +168,64 @@ class LEAPClient:
             for listener in listener_details.listeners:
                 listener.close_queue()
         self._pump_listeners.clear()
+        self._listener_pumps.clear()
 
     def command(
         self, pump: PUMP_NAME_TYPE, op: str, data: Optional[Dict] = None, op_key: str = "op"
     ) -> Optional[asyncio.Future]:
         """Make a request to an internal LEAP method using the standard command form (op in data)"""
-        data = data.copy() if data else {}
-        data[op_key] = op
-        return self.post(pump, data, expect_reply=True)
+        # Build our own copy of the payload in one go, `_post()` is then free to mutate it.
+        data = {**data, op_key: op} if data else {op_key: op}
+        return self._post(pump, data, expect_reply=True)
 
     def void_command(
         self, pump: PUMP_NAME_TYPE, op: str, data: Optional[Dict] = None, op_key: str = "op"
     ) -> None:
         """Like `command()`, but we don't expect a reply."""
-        data = data.copy() if data else {}
-        data[op_key] = op
-        self.post(pump, data, expect_reply=False)
+        data = {**data, op_key: op} if data else {op_key: op}
+        self._post(pump, data, expect_reply=False)
+
+    def void_command_many(
+        self, pump: PUMP_NAME_TYPE, commands: Iterable[Tuple[str, Optional[Dict]]], op_key: str = "op"
+    ) -> None:
+        """Like `void_command()`, but sends a sequence of `(op, data)` commands to `pump` in one write"""
+        with self.batch():
+            for op, data in commands:
+                self.void_command(pump, op, data, op_key=op_key)
+
+    def command_many(
+        self, pump: PUMP_NAME_TYPE, commands: Iterable[Tuple[str, Optional[Dict]]], op_key: str = "op"
+    ) -> List[asyncio.Future]:
+        """
+        Like `command()`, but sends a sequence of `(op, data)` commands to `pump` in one write
+
+        Commands are sent in order, and a reply future is returned for each.
+        """
+        with self.batch():
+            return [self.command(pump, op, data, op_key=op_key) for op, data in commands]
+
+    @contextlib.contextmanager
+    def batch(self) -> Iterator[None]:
+        """
+        Hold all messages posted within this scope and send them in a single write on exit
+
+        Only messages posted by the current task are held, other tasks can keep sending
+        while the batch is open. Replies can't arrive until the batch is sent, so don't
+        `await` any requests made within the scope until after it's exited!
+        """
+        task = asyncio.current_task()
+        if task in self._batched_messages:
+            # Already batching, the outermost `batch()` will do the sending.
+            yield
+            return
+        self._batched_messages[task] = []
+        try:
+            yield
+        finally:
+            messages = self._batched_messages.pop(task)
+            # Requests will have been cancelled if we disconnected in the meantime, nothing to send.
+            if messages and self.connected:
+                self._protocol.write_messages(messages)
 
     def post(self, pump: PUMP_NAME_TYPE, data: Any, expect_reply: bool) -> Optional[asyncio.Future]:
         """
@@ -152,6 +233,13 @@ class LEAPClient:
 
         Post the event is done synchronously, only waiting for the reply is done async.
         """
+        if expect_reply and isinstance(data, dict):
+            # We need to mutate the dict, make a copy so that we don't mess with the caller's version.
+            data = data.copy()
+        return self._post(pump, data, expect_reply)
+
+    def _post(self, pump: PUMP_NAME_TYPE, data: Any, expect_reply: bool) -> Optional[asyncio.Future]:
+        """Like `post()`, but may mutate `data`, which must not be shared with the caller"""
         assert self.connected
         if isinstance(pump, CommandPumpToken):
             pump = self.cmd_pump
@@ -164,8 +252,6 @@ class LEAPClient:
             # That means no reply tracking, meaning no future.
             if not isinstance(data, dict):
                 raise ValueError(f"Must send a dict in `data` if you want a reply, you sent {data!r}")
-            # We need to mutate the dict, make a copy so that we don't mess with the caller's version.
-            data = data.copy()
             # Tell the viewer the pump to send replies to
             data["reply"] = self._reply_pump
 
@@ -174,14 +260,21 @@ class LEAPClient:
 
             fut = asyncio.Future()
             # The future will be cleaned up when the Future is done.
-            fut.add_done_callback(self._cleanup_request_future)
+            fut.add_done_callback(functools.partial(self._cleanup_request_future, req_id))
             self._reply_futs[req_id] = fut
 
-        self._protocol.write_message(pump, data)
+        if (
+            self._batched_messages
+            and (batch := self._batched_messages.get(asyncio.current_task())) is not None
+        ):
+            batch.append((pump, data))
+        else:
+            self._protocol.write_message(pump, data)
         return fut
 
     def _gen_reqid(self) -> Any:
-        return uuid.uuid4()
+        self._next_reqid += 1
+        return self._next_reqid
 
     def listen_scoped(self, source_pump: str):
         return LEAPListenContextManager(self, source_pump)
@@ -196,6 +289,7 @@ class LEAPClient:
         had_listeners = bool(listener_details.listeners)
         listener = LEAPListener()
         listener_details.listeners.add(listener)
+        self._listener_pumps[listener] = source_pump
 
         if not had_listeners:
             # Nothing was listening to this before, need to ask for its events to be
@@ -212,28 +306,28 @@ class LEAPClient:
 
     async def stop_listening(self, listener: LEAPListener) -> None:
         """Stop sending a pump's messages to msg_queue, potentially removing the listen on the pump"""
-        for source_pump, listener_details in self._pump_listeners.items():
-            listeners = listener_details.listeners
-            if listener in listeners:
-                listeners.remove(listener)
-                listener.close_queue()
-                if self.connected and not listeners:
-                    # Nobody cares about these events anymore, ask LEAP to stop sending them
-                    await self.command(
-                        COMMAND_PUMP,
-                        "stoplistening",
-                        {
-                            "listener": listener_details.name,
-                            "source": source_pump,
-                        },
-                    )
-                return
-        raise KeyError(f"Couldn't find {listener!r} in pump listeners")
+        source_pump = self._listener_pumps.pop(listener, None)
+        if source_pump is None:
+            raise KeyError(f"Couldn't find {listener!r} in pump listeners")
+        listener_details = self._pump_listeners[source_pump]
+        listeners = listener_details.listeners
+        listeners.remove(listener)
+        listener.close_queue()
+        if self.connected and not listeners:
+            # Nobody cares about these events anymore, ask LEAP to stop sending them
+            await self.command(
+                COMMAND_PUMP,
+                "stoplistening",
+                {
+                    "listener": listener_details.name,
+                    "source": source_pump,
+                },
+            )
 
     def handle_message(self, message: Any) -> bool:
         """Handle an inbound message and try to route it to the right recipient"""
         if not isinstance(message, dict):
-            logging.warning(f"Received a non-map message: {message!r}")
+            logging.warning("Received a non-map message: %r", message)
             return False
 
         pump = message.get("pump")
@@ -241,18 +335,20 @@ class LEAPClient:
         if pump == self._reply_pump:
             # This is a reply for a request
             if not isinstance(data, dict):
-                logging.warning(f"Received a non-map reply over the reply pump: {message!r}")
+                logging.warning("Received a non-map reply over the reply pump: %r", message)
                 return False
 
             # reqid can tell us what future needs to be resolved, if any.
-            fut = self._reply_futs.get(data.get("reqid"))
+            # Take it out of the map now rather than waiting for its done callback.
+            fut = self._reply_futs.pop(data.get("reqid"), None)
             if not fut:
-                logging.warning(f"Received a reply over the reply pump with no reqid or future: {message!r}")
+                logging.warning("Received a reply over the reply pump with no reqid or future: %r", message)
                 return False
             # We don't actually care about the reqid, pop it off
             data.pop("reqid")
-            # Notify anyone awaiting the response
-            fut.set_result(data)
+            # Notify anyone awaiting the response, unless they've stopped caring.
+            if not fut.done():
+                fut.set_result(data)
             return True
 
         # Might be related to a listener we registered
@@ -265,15 +361,13 @@ class LEAPClient:
                 listener.put_nowait(data)
             return True
         else:
-            logging.warning(f"Received a message for unknown pump: {message!r}")
+            logging.warning("Received a message for unknown pump: %r", message)
         return False
 
-    def _cleanup_request_future(self, req_fut: asyncio.Future) -> None:
+    def _cleanup_request_future(self, req_id: Any, req_fut: asyncio.Future) -> None:
         """Remove a completed future from the reply map"""
-        for key, value in self._reply_futs.items():
-            if value == req_fut:
-                del self._reply_futs[key]
-                return
+        if self._reply_futs.get(req_id) is req_fut:
+            del self._reply_futs[req_id]
 
 
 class LEAPListenContextManager(AsyncContextManager[Callable[[], Awaitable[Any]]]):
@@ -308,47 +402,78 @@ class ConnectionStatus(enum.Enum):
 
 
 class LEAPListener:
-    """Wrapper for queue.get() that cancels if the client disconnects while `await`ing"""
+    """Message queue for a pump listener whose `get()` cancels if the client disconnects while `await`ing"""
+
+    __slots__ = ("_messages", "_waiters", "_closed")
 
     def __init__(self):
-        self._queue = asyncio.Queue()
-        self._shutdown_event = asyncio.Event()
+        self._messages: Deque[Any] = collections.deque()
+        # Futures for `get()`s waiting on a message or closure
+        self._waiters: Deque[asyncio.Future] = collections.deque()
+        self._closed = False
 
     def close_queue(self):
-        if not self._shutdown_event.is_set():
-            self._shutdown_event.set()
+        if not self._closed:
+            self._closed = True
+            # Wake everyone up so they can see that the queue's closed
+            self._wake_waiters(wake_all=True)
+
+    def _wake_waiters(self, wake_all: bool = False) -> None:
+        """Wake the next pending `get()`, or all of them if `wake_all`"""
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                if not wake_all:
+                    break
 
     async def get(self) -> Any:
         # Don't yield if we already have a message ready
-        if not self._queue.empty():
-            msg = self._queue.get_nowait()
-            self._queue.task_done()
-            return msg
+        if self._messages:
+            return self._messages.popleft()
 
-        if self._shutdown_event.is_set():
+        if self._closed:
             raise asyncio.QueueEmpty("Listener is closed and has no queued messages")
 
-        # Wait for a queue entry to be ready, or for client shutdown
-        queue_fut = asyncio.create_task(self._queue.get())
-        shutdown_fut = asyncio.create_task(self._shutdown_event.wait())
-        done, pending = await asyncio.wait([shutdown_fut, queue_fut], return_when=asyncio.FIRST_COMPLETED)
-        if done != {queue_fut}:
-            # Shutdown happened before the queue got populated
-            queue_fut.cancel()
-            raise asyncio.CancelledError("Client disconnected while waiting for event")
-        # We found a queue entry, don't care if shutdown happens anymore.
-        shutdown_fut.cancel()
-        # Consumption is completion for these queues.
-        self._queue.task_done()
-        # Re-awaiting is fine, it'll return the previous result.
-        return await queue_fut
+        # Wait for a message to be ready, or for client shutdown. This only needs a bare `Future`
+        # rather than racing tasks for the queue and the shutdown event.
+        while not self._messages:
+            if self._closed:
+                # Shutdown happened before the queue got populated
+                raise asyncio.CancelledError("Client disconnected while waiting for event")
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            except:
+                waiter.cancel()
+                try:
+                    self._waiters.remove(waiter)
+                except ValueError:
+                    pass
+                # We were woken for a message but won't be taking it, pass the wakeup along.
+                if self._messages and not waiter.cancelled():
+                    self._wake_waiters()
+                raise
+        return self._messages.popleft()
+
+    async def get_batch(self, max_n: int = 64) -> List[Any]:
+        """Wait for at least one message like `get()`, then return up to `max_n` of the queued messages"""
+        if max_n < 1:
+            raise ValueError(f"max_n must be at least 1, got {max_n}")
+        batch = [await self.get()]
+        messages = self._messages
+        while messages and len(batch) < max_n:
+            batch.append(messages.popleft())
+        return batch
 
     def empty(self) -> bool:
-        return self._queue.empty()
+        return not self._messages
 
     def put_nowait(self, val: Any) -> None:
-        assert not self._shutdown_event.is_set()
-        self._queue.put_nowait(val)
+        assert not self._closed
+        self._messages.append(val)
+        self._wake_waiters()
 
 
 @dataclasses.dataclass
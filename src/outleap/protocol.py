@@ -1,6 +1,7 @@
 import abc
 import asyncio
-from typing import *
+import uuid
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
 
 import llsd
 
@@ -18,6 +19,11 @@ class AbstractLEAPProtocol(abc.ABC):
     def write_message(self, pump: str, data: Any) -> None:
         pass
 
+    def write_messages(self, messages: Iterable[Tuple[str, Any]]) -> None:
+        """Write a sequence of `(pump, data)` messages, implementations may coalesce the writes"""
+        for pump, data in messages:
+            self.write_message(pump, data)
+
     @abc.abstractmethod
     async def read_message(self) -> Dict:
         pass
@@ -34,7 +40,7 @@ def parse_llsd(something: bytes) -> Any:
     # We need a special parser to remove indra's binary LLSD prefix.
     try:
         something = something.lstrip()  # remove any pre-trailing whitespace
-        if any(something.startswith(x) for x in _BINARY_HEADERS):
+        if something.startswith(_BINARY_HEADERS):
             return llsd.parse_binary(something.split(b"\n", 1)[1])
         # This should be better.
         elif llsd.starts_with(b"<", something):
@@ -47,10 +53,79 @@ def parse_llsd(something: bytes) -> Any:
         raise llsd.LLSDParseError("Input stream not of type bytes. %s" % (e,))
 
 
+class _LEAPNotationFormatter(llsd.serde_notation.LLSDNotationFormatter):
+    """Notation formatter that caches the serialized form of map keys"""
+
+    # LEAP payloads use the same handful of keys over and over ("op", "reqid", "path", ...)
+    # so there's no point in escaping and formatting them every time they're used.
+    # Cap the cache sizes so that maps with arbitrary user-specified keys can't grow them forever.
+    KEY_CACHE_LIMIT = 1024
+
+    def __init__(self):
+        super().__init__()
+        self._key_cache: Dict[str, bytes] = {}
+        self._envelope_cache: Dict[str, bytes] = {}
+        self._uuid_cache: Dict[uuid.UUID, bytes] = {}
+
+    def _format_key(self, key: Any) -> bytes:
+        # Only cache `str` keys, things like `1` and `True` hash the same but format differently.
+        is_str = type(key) is str
+        if is_str:
+            formatted = self._key_cache.get(key)
+            if formatted is not None:
+                return formatted
+        escaped = str(key).encode("utf8").replace(b"\\", b"\\\\").replace(b"'", b"\\'")
+        formatted = b"'%s':" % escaped
+        if is_str and len(self._key_cache) < self.KEY_CACHE_LIMIT:
+            self._key_cache[key] = formatted
+        return formatted
+
+    # The base formatter's handlers encode their format strings to bytes on every call,
+    # which adds up for payloads with lots of scalars, like puppetry joint data.
+    def INTEGER(self, v: int) -> bytes:
+        return b"i%d" % v
+
+    def REAL(self, v: float) -> bytes:
+        return b"r%r" % v
+
+    def STRING(self, v: str) -> bytes:
+        return b"'%s'" % v.encode("utf8").replace(b"\\", b"\\\\").replace(b"'", b"\\'")
+
+    def UUID(self, v: uuid.UUID) -> bytes:
+        # The same handful of IDs (groups, gestures, objects) tend to get sent over and over,
+        # and stringifying a UUID is surprisingly expensive.
+        formatted = self._uuid_cache.get(v)
+        if formatted is None:
+            formatted = b"u%s" % str(v).encode("latin-1")
+            if len(self._uuid_cache) < self.KEY_CACHE_LIMIT:
+                self._uuid_cache[v] = formatted
+        return formatted
+
+    def ARRAY(self, v: Iterable) -> bytes:
+        return b"[%s]" % b",".join([self._generate(item) for item in v])
+
+    def MAP(self, v: Dict) -> bytes:
+        return b"{%s}" % b",".join(
+            [self._format_key(key) + self._generate(value) for key, value in v.items()]
+        )
+
+    def format_message(self, pump: str, data: Any) -> bytes:
+        """Format a LEAP message envelope, equivalent to `format({"pump": pump, "data": data})`"""
+        # Everything up to the data is the same for every message sent to a given pump
+        prefix = self._envelope_cache.get(pump)
+        if prefix is None:
+            prefix = b"{'pump':%s,'data':" % self._generate(pump)
+            if len(self._envelope_cache) < self.KEY_CACHE_LIMIT:
+                self._envelope_cache[pump] = prefix
+        return prefix + self._generate(data) + b"}"
+
+
 class LEAPProtocol(AbstractLEAPProtocol):
     """Wrapper for communication with a LEAP peer over an asyncio reader/writer pair"""
 
     PAYLOAD_LIMIT = 0x0FFFFFFF
+    # Flush buffered writes immediately once they get this large
+    WRITE_BUFFER_LIMIT = 0x10000
 
     def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
         self._reader = reader
@@ -58,8 +133,10 @@ class LEAPProtocol(AbstractLEAPProtocol):
         # We could receive any kind of LLSD, so we have to use a parser that
         # can handle anything via content type sniffing.
         self._parser: LLSD_PARSE_FUNC = parse_llsd
-        self._formatter = llsd.serde_notation.LLSDNotationFormatter()
+        self._formatter = _LEAPNotationFormatter()
         self._drain_task = None
+        self._write_buf = bytearray()
+        self._flush_handle: Optional[asyncio.Handle] = None
 
     @property
     def closed(self) -> bool:
@@ -67,22 +144,62 @@ class LEAPProtocol(AbstractLEAPProtocol):
 
     def close(self):
         if not self._writer.is_closing():
+            self._flush()
             self._writer.write_eof()
             self._writer.close()
 
+    def _serialize_message(self, pump: str, data: Any, payload: bytearray) -> None:
+        """Append the framed serialization of a message to `payload`"""
+        ser = self._formatter.format_message(pump, data)
+        payload += b"%d:" % len(ser)
+        payload += ser
+
     def write_message(self, pump: str, data: Any) -> None:
         assert not self._writer.is_closing()
-        ser = self._formatter.format({"pump": pump, "data": data})
-        payload = bytearray(str(len(ser)).encode("utf8"))
-        payload.extend(b":")
-        payload.extend(ser)
+        self._serialize_message(pump, data, self._write_buf)
+        self._schedule_flush()
+
+    def write_messages(self, messages: Iterable[Tuple[str, Any]]) -> None:
+        assert not self._writer.is_closing()
+        for pump, data in messages:
+            self._serialize_message(pump, data, self._write_buf)
+        self._schedule_flush()
+
+    def _schedule_flush(self) -> None:
+        # Messages are often written in bursts from sync code (`text_input()`, a bunch of
+        # `command()`s followed by a `gather()`, etc.) Rather than doing a write per message,
+        # buffer everything written during this tick of the event loop and write it all at once.
+        if len(self._write_buf) >= self.WRITE_BUFFER_LIMIT:
+            self._flush()
+        elif self._write_buf and not self._flush_handle:
+            self._flush_handle = asyncio.get_running_loop().call_soon(self._flush)
+
+    def _flush(self) -> None:
+        if self._flush_handle:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if not self._write_buf or self._writer.is_closing():
+            return
+        # The transport may hang on to what we give it, so hand over the buffer and start a new one
+        # rather than mutating it after the fact.
+        payload, self._write_buf = self._write_buf, bytearray()
         self._writer.write(payload)
         # We're in sync context, we need to schedule draining the socket, which is async.
-        # If a drain is already scheduled then we don't need to reschedule.
-        if not self._drain_task:
+        # If a drain is already scheduled then we don't need to reschedule. Draining only
+        # does anything if the transport couldn't send everything immediately, so don't
+        # bother spinning up a task for it otherwise.
+        if not self._drain_task and self._transport_backlogged():
             self._drain_task = asyncio.create_task(self._drain_soon())
 
+    def _transport_backlogged(self) -> bool:
+        try:
+            return self._writer.transport.get_write_buffer_size() > 0
+        except NotImplementedError:
+            # Can't tell, assume the worst.
+            return True
+
     async def drain(self) -> None:
+        self._flush()
         if self._drain_task:
             await self._drain_task
         else:
@@ -96,7 +213,8 @@ class LEAPProtocol(AbstractLEAPProtocol):
         assert not self._reader.at_eof()
 
         # Length is everything up until the first colon we see, stripping the colon off.
-        length = int((await self._reader.readuntil(b":"))[:-1].decode("utf8"))
+        # `int()` takes the ASCII digits as bytes directly, no need to decode them first.
+        length = int((await self._reader.readuntil(b":"))[:-1])
         if length > self.PAYLOAD_LIMIT:
             raise ValueError(f"Unreasonable LEAP payload length of {length}")
         # Everything after the colon is LLSD
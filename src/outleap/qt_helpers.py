@@ -1,6 +1,6 @@
 import asyncio
 import html
-from typing import *
+from typing import List, Optional, Tuple
 
 from PySide6 import QtWidgets
 from PySide6.QtCore import QMetaObject
@@ -14,7 +14,7 @@ import os
 import sys
 
 from outleap import LEAPProtocol
-from outleap.utils import connect_stdin_stdout
+from outleap.utils import connect_stdin_stdout, use_uvloop
 
 
 async def _forward_stream(src_reader: asyncio.StreamReader, dst_writer: asyncio.StreamWriter):
@@ -49,6 +49,7 @@ async def amain():
 
 
 def agent_main():
+    use_uvloop()
     asyncio.run(amain())
 
 
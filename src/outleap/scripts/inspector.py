@@ -7,7 +7,7 @@ import signal
 import sys
 import tempfile
 import weakref
-from typing import *
+from typing import Optional, Sequence
 
 import pkg_resources
 from PySide6 import QtCore, QtGui, QtWidgets
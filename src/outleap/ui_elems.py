@@ -4,22 +4,46 @@ import asyncio
 import collections
 import dataclasses
 import weakref
-from typing import *
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Collection,
+    Dict,
+    Generic,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
 if TYPE_CHECKING:
     from .api_wrappers import LLWindowAPI
 
 
 class UIPath:
-    __slots__ = ["_parts", "__weakref__"]
+    __slots__ = ["_parts", "_str", "__weakref__"]
     # UIPaths are immutable, so we can maintain a cache of instances based on
     # the parts that make up the path.
     _INSTANCES: Dict[Tuple[str, ...], UIPath] = weakref.WeakValueDictionary()
+    # Same, but keyed on the string the path was parsed from. Paths come back from
+    # `getPaths` as strings, often thousands at a time, so skipping the parse is worth it.
+    _STR_INSTANCES: Dict[str, UIPath] = weakref.WeakValueDictionary()
 
     def __new__(cls, *args):
+        path_str = None
         if len(args) == 1:
             if isinstance(args[0], str):
-                args = args[0].split("/")
+                path_str = args[0]
+                val = cls._STR_INSTANCES.get(path_str)
+                if val is not None:
+                    return val
+                args = path_str.split("/")
                 # "." means "/" in LEAP
                 if tuple(args) == (".",):
                     args = ()
@@ -35,19 +59,26 @@ class UIPath:
 
         # Check if we have a cached UIPath instance for these args first
         val = cls._INSTANCES.get(args)
-        if val is not None:
-            return val
-        val = super().__new__(cls)
-        val._parts = args
-        cls._INSTANCES[args] = val
+        if val is None:
+            val = super().__new__(cls)
+            val._parts = args
+            # Lazily populated by `__str__()`
+            val._str = None
+            cls._INSTANCES[args] = val
+        if path_str is not None:
+            cls._STR_INSTANCES[path_str] = val
         return val
 
     @classmethod
     def for_floater(cls, floater_name: str) -> UIPath:
-        return cls("/main_view/menu_stack/world_panel/Floater View") / floater_name
+        return _FLOATER_VIEW_PATH / floater_name
 
     def __str__(self) -> str:
-        return "/" + "/".join(self._parts)
+        # Paths get stringified whenever they're put in a payload, and they're immutable,
+        # so it's worth caching the result.
+        if self._str is None:
+            self._str = "/" + "/".join(self._parts)
+        return self._str
 
     def __repr__(self):
         return f"{self.__class__.__name__}({self!s})"
@@ -96,6 +127,9 @@ class UIPath:
         return self_len >= other_len and self._parts[:other_len] == other._parts
 
 
+_FLOATER_VIEW_PATH = UIPath("/main_view/menu_stack/world_panel/Floater View")
+
+
 class UIRect(NamedTuple):
     bottom: int
     left: int
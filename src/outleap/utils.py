@@ -5,7 +5,7 @@ import stat
 import sys
 import threading
 import time
-from typing import *
+from typing import Any, Tuple, Union
 
 
 class HackySTDIOTransport(asyncio.Transport):
@@ -166,6 +166,22 @@ async def connect_stdin_stdout() -> Tuple[asyncio.StreamReader, asyncio.StreamWr
     return reader, writer
 
 
+def use_uvloop() -> bool:
+    """
+    Make asyncio use uvloop's event loop, if it's available
+
+    Must be called before the event loop is created. Returns whether uvloop is now in use.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        # Not installed, or we're on Windows where uvloop isn't supported.
+        return False
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
+
 __all__ = [
     "connect_stdin_stdout",
+    "use_uvloop",
 ]
@@ -1,6 +1,6 @@
 import asyncio
 import unittest
-from typing import *
+from typing import Any, Dict, Optional
 
 import outleap
 
@@ -23,23 +23,11 @@ class MockLEAPProtocol(outleap.AbstractLEAPProtocol):
         return msg
 
 
-class MockReqIDGenerator:
-    """Predictable reqid generator for request reply tracking"""
-
-    def __init__(self):
-        self.ctr = 0
-
-    def __call__(self, *args, **kwargs):
-        self.ctr += 1
-        return self.ctr
-
-
 class BaseClientTest(unittest.IsolatedAsyncioTestCase):
     async def asyncSetUp(self) -> None:
         self.loop = asyncio.get_running_loop()
         self.protocol = MockLEAPProtocol()
         self.client = outleap.LEAPClient(self.protocol)
-        self.client._gen_reqid = MockReqIDGenerator()
 
     async def asyncTearDown(self) -> None:
         self.client.disconnect()
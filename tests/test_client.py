@@ -69,6 +69,83 @@ class ProtocolTests(BaseClientTest):
             {"pump": "foopump", "data": {"op": "baz", "bar": 1}}, self.protocol.sent_messages[-1]
         )
 
+    async def test_command_doesnt_mutate_data(self):
+        self._write_welcome()
+        await self.client.connect()
+        data = {"bar": 1}
+        self.client.command("foopump", "baz", data)
+        self.client.void_command("foopump", "baz", data)
+        self.client.post("foopump", data, expect_reply=True)
+        self.assertDictEqual({"bar": 1}, data)
+
+    async def test_void_command_many(self):
+        self._write_welcome()
+        await self.client.connect()
+        self.client.void_command_many("foopump", [("baz", {"bar": 1}), ("quux", None)])
+        self.assertListEqual(
+            [
+                {"pump": "foopump", "data": {"op": "baz", "bar": 1}},
+                {"pump": "foopump", "data": {"op": "quux"}},
+            ],
+            self.protocol.sent_messages,
+        )
+
+    async def test_command_many(self):
+        self._write_welcome()
+        await self.client.connect()
+        futs = self.client.command_many("foopump", [("baz", {"bar": 1}), ("quux", None)])
+        self.assertListEqual(
+            [
+                {"pump": "foopump", "data": {"op": "baz", "bar": 1, "reply": "reply_pump", "reqid": 1}},
+                {"pump": "foopump", "data": {"op": "quux", "reply": "reply_pump", "reqid": 2}},
+            ],
+            self.protocol.sent_messages,
+        )
+        self._write_reply(2, {"foo": 2})
+        self._write_reply(1, {"foo": 1})
+        self.assertListEqual(
+            [{"foo": 1}, {"foo": 2}], list(await asyncio.wait_for(asyncio.gather(*futs), timeout=0.05))
+        )
+
+    async def test_batch(self):
+        self._write_welcome()
+        await self.client.connect()
+        with self.client.batch():
+            self.client.void_command("foopump", "baz")
+            fut = self.client.command("foopump", "quux")
+            with self.client.batch():
+                self.client.void_command("foopump", "nested")
+            # Nothing should have been sent yet
+            self.assertListEqual([], self.protocol.sent_messages)
+        self.assertListEqual(
+            [
+                {"pump": "foopump", "data": {"op": "baz"}},
+                {"pump": "foopump", "data": {"op": "quux", "reply": "reply_pump", "reqid": 1}},
+                {"pump": "foopump", "data": {"op": "nested"}},
+            ],
+            self.protocol.sent_messages,
+        )
+        # Replies to batched requests should still be routed correctly
+        self._write_reply(1, {"foo": 1})
+        self.assertEqual({"foo": 1}, await asyncio.wait_for(fut, timeout=0.05))
+
+    async def test_batch_other_tasks(self):
+        self._write_welcome()
+        await self.client.connect()
+
+        async def _other_task():
+            fut = self.client.command("foopump", "ping")
+            # Shouldn't be held back by the other task's batch
+            self.assertEqual(1, len(self.protocol.sent_messages))
+            self._write_reply(1, {"foo": 1})
+            return await asyncio.wait_for(fut, timeout=0.05)
+
+        with self.client.batch():
+            self.client.void_command("foopump", "batched")
+            self.assertEqual({"foo": 1}, await asyncio.create_task(_other_task()))
+            self.assertEqual(1, len(self.protocol.sent_messages))
+        self.assertEqual({"pump": "foopump", "data": {"op": "batched"}}, self.protocol.sent_messages[-1])
+
     async def test_command(self):
         self._write_welcome()
         await self.client.connect()
@@ -92,6 +169,31 @@ class ProtocolTests(BaseClientTest):
         await asyncio.sleep(0)
         self.assertEqual({"foo": 1}, await asyncio.wait_for(fut, timeout=0.05))
 
+    async def test_reply_futs_cleaned_up(self):
+        self._write_welcome()
+        await self.client.connect()
+        replied_fut = self.client.command("foopump", "baz")
+        cancelled_fut = self.client.command("foopump", "quux")
+        self.assertEqual(2, len(self.client._reply_futs))
+        self._write_reply(1, {"foo": 1})
+        await asyncio.wait_for(replied_fut, timeout=0.05)
+        cancelled_fut.cancel()
+        # Let the done callbacks run
+        await asyncio.sleep(0)
+        self.assertDictEqual({}, self.client._reply_futs)
+
+    async def test_reply_to_cancelled_command(self):
+        self._write_welcome()
+        await self.client.connect()
+        cancelled_fut = self.client.command("foopump", "baz")
+        cancelled_fut.cancel()
+        # Reply comes in before the cancelled future's callbacks have had a chance to run
+        self.client.handle_message({"pump": "reply_pump", "data": {"reqid": 1}})
+        # The client should still be usable
+        fut = self.client.command("foopump", "quux")
+        self._write_reply(2, {"foo": 1})
+        self.assertEqual({"foo": 1}, await asyncio.wait_for(fut, timeout=0.05))
+
     async def test_disconnect_pending_command(self):
         self._write_welcome()
         async with self.client:
@@ -154,6 +256,9 @@ class ProtocolTests(BaseClientTest):
         # Pretend a reply came in stopping the listen
         self._write_reply(2)
         await stop_listen_fut
+        # Already unregistered
+        with self.assertRaises(KeyError):
+            await self.client.stop_listening(listener)
 
     async def test_listen_shutdown(self):
         self._write_welcome()
@@ -176,6 +281,36 @@ class ProtocolTests(BaseClientTest):
         with self.assertRaises(asyncio.QueueEmpty):
             await listener.get()
 
+    async def test_listen_multiple_getters(self):
+        self._write_welcome()
+        await self.client.connect()
+        listen_fut = self.client.listen("SomeState")
+        self._write_reply(1)
+        listener = await listen_fut
+
+        getters = [asyncio.create_task(listener.get()) for _ in range(3)]
+        await asyncio.sleep(0)
+        # Cancelling a waiting get() shouldn't eat a message meant for another
+        getters[0].cancel()
+        for data in ("hi", "there"):
+            self.protocol.inbound_messages.put_nowait({"pump": "SomeState", "data": data})
+        self.assertListEqual(["hi", "there"], await asyncio.wait_for(asyncio.gather(*getters[1:]), 0.05))
+        self.assertTrue(getters[0].cancelled())
+        self.assertTrue(listener.empty())
+
+    async def test_listen_get_batch(self):
+        self._write_welcome()
+        await self.client.connect()
+        listen_fut = self.client.listen("SomeState")
+        self._write_reply(1)
+        listener = await listen_fut
+
+        for data in ("a", "b", "c"):
+            self.protocol.inbound_messages.put_nowait({"pump": "SomeState", "data": data})
+        self.assertListEqual(["a", "b"], await asyncio.wait_for(listener.get_batch(2), 0.05))
+        self.assertListEqual(["c"], await listener.get_batch())
+        self.assertTrue(listener.empty())
+
     async def test_listen_message_from_before_disconnect(self):
         self._write_welcome()
         await self.client.connect()
@@ -1,7 +1,8 @@
 import asyncio
 import unittest
 import unittest.mock
-from typing import *
+import uuid
+from typing import Any, Union
 
 import llsd
 
@@ -12,6 +13,8 @@ class MockTransport(asyncio.Transport):
     def __init__(self):
         super().__init__()
         self.written_data = bytearray()
+        # Bytes the transport pretends it couldn't send immediately
+        self.write_buffer_size = 0
         self.closed = False
         self.wrote_eof = False
 
@@ -34,6 +37,9 @@ class MockTransport(asyncio.Transport):
     def write(self, data: Any) -> None:
         self.written_data.extend(data)
 
+    def get_write_buffer_size(self) -> int:
+        return self.write_buffer_size
+
 
 class MockProtocol(asyncio.Protocol):
     def __init__(self):
@@ -76,6 +82,60 @@ class ProtocolTests(unittest.IsolatedAsyncioTestCase):
 
     async def test_write(self):
         self.leap_protocol.write_message("foo", {})
+        await self.leap_protocol.drain()
+        self.assertEqual(b"24:{'pump':'foo','data':{}}", self.transport.written_data)
+
+    async def test_write_many(self):
+        self.leap_protocol.write_messages([("foo", {}), ("bar", {})])
+        await self.leap_protocol.drain()
+        self.assertEqual(
+            b"24:{'pump':'foo','data':{}}24:{'pump':'bar','data':{}}", self.transport.written_data
+        )
+
+    async def test_write_matches_llsd_formatter(self):
+        data = {
+            "op": "foo",
+            "it's": [1, 2.5, None, -3, 1e100, float("inf")],
+            "nested": {"\\": "b'a\\r\u00e9", 1: True},
+            "tuple": (False, "", 0.0),
+            "uuids": [uuid.UUID(int=1), uuid.UUID(int=1)],
+        }
+        self.leap_protocol.write_message("foo", data)
+        await self.leap_protocol.drain()
+        ser = llsd.format_notation({"pump": "foo", "data": data})
+        self.assertEqual(str(len(ser)).encode("utf8") + b":" + ser, self.transport.written_data)
+
+    async def test_write_coalesced(self):
+        self.leap_protocol.write_message("foo", {})
+        self.leap_protocol.write_message("bar", {})
+        # Nothing should be written until the event loop gets a chance to run
+        self.assertEqual(b"", self.transport.written_data)
+        await asyncio.sleep(0)
+        self.assertEqual(
+            b"24:{'pump':'foo','data':{}}24:{'pump':'bar','data':{}}", self.transport.written_data
+        )
+
+    async def test_drain_only_when_backlogged(self):
+        self.leap_protocol.write_message("foo", {})
+        await asyncio.sleep(0)
+        # Everything was sent, no reason to drain
+        self.assertIsNone(self.leap_protocol._drain_task)
+
+        self.transport.write_buffer_size = 10
+        self.leap_protocol.write_message("foo", {})
+        await asyncio.sleep(0)
+        self.assertIsNotNone(self.leap_protocol._drain_task)
+        await self.leap_protocol.drain()
+
+    async def test_write_over_buffer_limit(self):
+        with unittest.mock.patch.object(self.leap_protocol, "WRITE_BUFFER_LIMIT", 10):
+            self.leap_protocol.write_message("foo", {})
+        # Should be written immediately since it's over the buffer limit
+        self.assertEqual(b"24:{'pump':'foo','data':{}}", self.transport.written_data)
+
+    async def test_close_flushes(self):
+        self.leap_protocol.write_message("foo", {})
+        self.leap_protocol.close()
         self.assertEqual(b"24:{'pump':'foo','data':{}}", self.transport.written_data)
 
     async def test_read_non_dict(self):
@@ -14,20 +14,9 @@ import asyncio
 from outleap import LEAPClient, LLViewerControlAPI
 
 
-class MockReqIDGenerator:
-    def __init__(self):
-        self.ctr = 0
-
-    def __call__(self, *args, **kwargs):
-        self.ctr += 1
-        return self.ctr
-
-
 async def amain():
     # Create a client speaking LEAP over stdin/stdout and connect it
     async with await LEAPClient.create_stdio_client() as client:
-        # Use monotonically incrementing integer for reqids
-        client._gen_reqid = MockReqIDGenerator()
         # Use our typed wrapper around the LLViewerControl LEAP API
         viewer_control_api = LLViewerControlAPI(client)
         # Ask for a config value and print it in the viewer logs
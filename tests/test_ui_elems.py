@@ -1,7 +1,7 @@
 import asyncio
 import pathlib
 import unittest
-from typing import *
+from typing import Dict, List, Optional
 
 import outleap
 from outleap import UIPath
@@ -46,6 +46,20 @@ class TestUIPaths(unittest.TestCase):
         self.assertEqual("/foo/bar/baz", str(UIPath("/foo/bar") / "baz"))
         self.assertEqual("/foo/bar/baz", str("/foo/bar" / UIPath("baz")))
 
+    def test_str_instances(self):
+        path = UIPath("/foo/bar")
+        self.assertIs(path, UIPath("/foo/bar"))
+        self.assertIs(path, UIPath("foo//bar/"))
+        self.assertIs(path, UIPath("foo", "bar"))
+
+    def test_str_cached(self):
+        path = UIPath("/foo/bar")
+        self.assertEqual("/foo/bar", str(path))
+        self.assertIs(str(path), str(path))
+
+    def test_for_floater(self):
+        self.assertEqual("/main_view/menu_stack/world_panel/Floater View/foo", str(UIPath.for_floater("foo")))
+
     def test_eq(self):
         self.assertEqual(UIPath("/foo/bar"), UIPath("/foo/bar"))
         self.assertNotEqual(UIPath("/foo/bar"), UIPath("/foo"))
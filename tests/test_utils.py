@@ -0,0 +1,23 @@
+import sys
+import types
+import unittest
+import unittest.mock
+
+import outleap
+
+
+class UseUVLoopTests(unittest.TestCase):
+    def test_uvloop_missing(self):
+        # A `None` entry in `sys.modules` makes importing it raise `ImportError`
+        with unittest.mock.patch.dict(sys.modules, {"uvloop": None}):
+            with unittest.mock.patch("asyncio.set_event_loop_policy") as set_policy:
+                self.assertFalse(outleap.use_uvloop())
+        set_policy.assert_not_called()
+
+    def test_uvloop_available(self):
+        fake_uvloop = types.ModuleType("uvloop")
+        fake_uvloop.EventLoopPolicy = unittest.mock.Mock(name="EventLoopPolicy")
+        with unittest.mock.patch.dict(sys.modules, {"uvloop": fake_uvloop}):
+            with unittest.mock.patch("asyncio.set_event_loop_policy") as set_policy:
+                self.assertTrue(outleap.use_uvloop())
+        set_policy.assert_called_once_with(fake_uvloop.EventLoopPolicy.return_value)
@@ -1,3 +1,5 @@
+import asyncio
+
 import outleap
 
 from . import BaseClientTest
@@ -11,6 +13,13 @@ class TestWrappers(BaseClientTest):
 
         # Make sure the request looks like what we'd expect
         fut = llwindow_api.mouse_click(x=0, y=1, mask=["CTL"], button="LEFT")
+        self.assertDictEqual(
+            {
+                "pump": "LLWindow",
+                "data": {"x": 0, "y": 1, "mask": ["CTL"], "button": "LEFT", "op": "mouseDown"},
+            },
+            self.protocol.sent_messages[-2],
+        )
         self.assertDictEqual(
             {
                 "pump": "LLWindow",
@@ -47,12 +56,88 @@ class TestWrappers(BaseClientTest):
 
         # Make sure the request looks like what we'd expect
         llwindow_api.key_press(char="f", mask=["CTL"])
+        self.assertDictEqual(
+            {"pump": "LLWindow", "data": {"char": "f", "mask": ["CTL"], "op": "keyDown"}},
+            self.protocol.sent_messages[-2],
+        )
         self.assertDictEqual(
             {"pump": "LLWindow", "data": {"char": "f", "mask": ["CTL"], "op": "keyUp"}},
             self.protocol.sent_messages[-1],
         )
         self.assertEqual(2, len(self.protocol.sent_messages[-1]))
 
+    async def test_text_input(self):
+        self._write_welcome()
+        await self.client.connect()
+        llwindow_api = outleap.LLWindowAPI(self.client)
+
+        llwindow_api.text_input("hi")
+        self.assertListEqual(
+            [
+                {"pump": "LLWindow", "data": {"char": "h", "op": "keyDown"}},
+                {"pump": "LLWindow", "data": {"char": "h", "op": "keyUp"}},
+                {"pump": "LLWindow", "data": {"char": "i", "op": "keyDown"}},
+                {"pump": "LLWindow", "data": {"char": "i", "op": "keyUp"}},
+            ],
+            self.protocol.sent_messages,
+        )
+
+    async def test_text_input_path(self):
+        self._write_welcome()
+        await self.client.connect()
+        llwindow_api = outleap.LLWindowAPI(self.client)
+
+        llwindow_api.text_input("h", path=outleap.UIPath("/foo"))
+        self.assertListEqual(
+            [
+                {"pump": "LLWindow", "data": {"char": "h", "path": "/foo", "op": "keyDown"}},
+                {"pump": "LLWindow", "data": {"char": "h", "path": "/foo", "op": "keyUp"}},
+            ],
+            self.protocol.sent_messages,
+        )
+
+    async def test_mouse_move_coalesced(self):
+        self._write_welcome()
+        await self.client.connect()
+        llwindow_api = outleap.LLWindowAPI(self.client)
+
+        llwindow_api.mouse_move_coalesced(x=0, y=0)
+        llwindow_api.mouse_move_coalesced(x=1, y=2)
+        self.assertListEqual([], self.protocol.sent_messages)
+        await asyncio.sleep(0)
+        # Only the latest move should have been sent
+        self.assertListEqual(
+            [{"pump": "LLWindow", "data": {"x": 1, "y": 2, "op": "mouseMove"}}],
+            self.protocol.sent_messages,
+        )
+
+    async def test_mouse_move_coalesced_flushed_before_click(self):
+        self._write_welcome()
+        await self.client.connect()
+        llwindow_api = outleap.LLWindowAPI(self.client)
+
+        llwindow_api.mouse_move_coalesced(x=1, y=2)
+        llwindow_api.mouse_click(x=1, y=2, button="LEFT")
+        self.assertListEqual(
+            ["mouseMove", "mouseDown", "mouseUp"],
+            [msg["data"]["op"] for msg in self.protocol.sent_messages],
+        )
+        # Already sent, shouldn't be sent again.
+        await asyncio.sleep(0)
+        self.assertEqual(3, len(self.protocol.sent_messages))
+
+    async def test_mouse_move_coalesced_flushed_before_scroll(self):
+        self._write_welcome()
+        await self.client.connect()
+        llwindow_api = outleap.LLWindowAPI(self.client)
+
+        llwindow_api.mouse_move_coalesced(x=1, y=2)
+        llwindow_api.mouse_scroll(3)
+        self.assertListEqual(
+            ["mouseMove", "mouseScroll"],
+            [msg["data"]["op"] for msg in self.protocol.sent_messages],
+        )
+
     async def test_uipath_key_down(self):
         self._write_welcome()
         await self.client.connect()
@@ -71,6 +156,126 @@ class TestWrappers(BaseClientTest):
             self.protocol.sent_messages[-1],
         )
 
+    async def test_data_unwrapper(self):
+        self._write_welcome()
+        await self.client.connect()
+        ui_api = outleap.LLUIAPI(self.client)
+
+        fut = ui_api.get_value("/foo")
+        self._write_reply(1, {"value": "bar"})
+        self.assertEqual("bar", await fut)
+
+    async def test_data_unwrapper_cancelled(self):
+        self._write_welcome()
+        await self.client.connect()
+        ui_api = outleap.LLUIAPI(self.client)
+
+        fut = ui_api.get_value("/foo")
+        # Pending requests get cancelled on disconnect, unwrapped values should be too.
+        self.client.disconnect()
+        with self.assertRaises(asyncio.CancelledError):
+            await fut
+
+    async def test_data_unwrapper_cancel_request(self):
+        self._write_welcome()
+        await self.client.connect()
+        ui_api = outleap.LLUIAPI(self.client)
+
+        fut = ui_api.get_value("/foo")
+        self.assertEqual(1, len(self.client._reply_futs))
+        # Cancelling the unwrapped value should cancel the underlying request
+        fut.cancel()
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        self.assertDictEqual({}, self.client._reply_futs)
+
+    async def test_look_at_many(self):
+        self._write_welcome()
+        await self.client.connect()
+        agent_api = outleap.LLAgentAPI(self.client)
+
+        agent_api.look_at_many([(1.0, 2.0, 3.0), [4.0, 5.0, 6.0]])
+        self.assertListEqual(
+            [
+                {"pump": "LLAgent", "data": {"type": 8, "position": [1.0, 2.0, 3.0], "op": "lookAt"}},
+                {"pump": "LLAgent", "data": {"type": 8, "position": [4.0, 5.0, 6.0], "op": "lookAt"}},
+            ],
+            self.protocol.sent_messages,
+        )
+
+    async def test_instance_visible_not_shared(self):
+        self._write_welcome()
+        await self.client.connect()
+        floater_reg_api = outleap.LLFloaterRegAPI(self.client)
+
+        first_fut = floater_reg_api.is_instance_visible("inventory")
+        # Visibility may change between the checks, so each needs its own request.
+        outleap.LLFloaterRegAPI(self.client).show_instance("inventory")
+        second_fut = floater_reg_api.is_instance_visible("inventory")
+        self.assertEqual(3, len(self.protocol.sent_messages))
+        self._write_reply(1, {"visible": False})
+        self._write_reply(2, {"visible": True})
+        self.assertFalse(await asyncio.wait_for(first_fut, timeout=0.05))
+        self.assertTrue(await asyncio.wait_for(second_fut, timeout=0.05))
+
+    async def test_viewer_control_read_after_write(self):
+        self._write_welcome()
+        await self.client.connect()
+        control_api = outleap.LLViewerControlAPI(self.client)
+
+        first_fut = control_api.get("Global", "Foo")
+        # A set() through any wrapper must be visible to gets made after it
+        outleap.LLViewerControlAPI(self.client).set("Global", "Foo", 2)
+        second_fut = control_api.get("Global", "Foo")
+        self.assertEqual(3, len(self.protocol.sent_messages))
+
+        self._write_reply(1, {"value": 1})
+        self._write_reply(2, {"value": 2})
+        self.assertEqual(1, (await asyncio.wait_for(first_fut, timeout=0.05))["value"])
+        self.assertEqual(2, (await asyncio.wait_for(second_fut, timeout=0.05))["value"])
+
+    async def test_puppetry_move(self):
+        self._write_welcome()
+        await self.client.connect()
+        puppetry_api = outleap.LLPuppetryAPI(self.client)
+
+        puppetry_api.move({"mWristLeft": {"rot": [0.0, 0.0, 0.0]}})
+        self.assertDictEqual(
+            {"pump": "puppetry", "data": {"mWristLeft": {"rot": [0.0, 0.0, 0.0]}, "command": "move"}},
+            self.protocol.sent_messages[-1],
+        )
+
+    async def test_dispatch_defaults(self):
+        self._write_welcome()
+        await self.client.connect()
+        dispatcher_api = outleap.LLCommandDispatcherAPI(self.client)
+
+        dispatcher_api.dispatch("foo")
+        self.assertDictEqual(
+            {
+                "pump": "LLCommandDispatcher",
+                "data": {"cmd": "foo", "params": (), "query": {}, "trusted": True, "op": "dispatch"},
+            },
+            self.protocol.sent_messages[-1],
+        )
+
+    async def test_shared_wrappers(self):
+        window_api = self.client.api(outleap.LLWindowAPI)
+        self.assertIsInstance(window_api, outleap.LLWindowAPI)
+        self.assertIs(window_api, outleap.LLWindowAPI.for_client(self.client))
+        self.assertIsNot(window_api, outleap.LLWindowAPI(self.client))
+
+    async def test_wrapper_no_pump_name(self):
+        with self.assertRaises(ValueError):
+            outleap.LEAPAPIWrapper(self.client)
+
+    async def test_wrappers_slotted(self):
+        for name in outleap.api_wrappers.__all__:
+            wrapper_cls = getattr(outleap, name)
+            if wrapper_cls is outleap.LEAPAPIWrapper:
+                continue
+            self.assertFalse(hasattr(wrapper_cls(self.client), "__dict__"), name)
+
     async def test_command_wrapper(self):
         self._write_welcome()
         await self.client.connect()
@@ -99,3 +304,43 @@ class TestWrappers(BaseClientTest):
             }
         )
         self.assertEqual("foo", (await fut)["whatever"])
+
+    async def test_cached_responses_copied(self):
+        self._write_welcome()
+        await self.client.connect()
+
+        command_api = outleap.CommandAPI(self.client)
+        fut1 = command_api.get_api("foo")
+        fut2 = command_api.get_api("foo")
+        self._write_reply(1, {"ops": [1]})
+        resp1 = await asyncio.wait_for(fut1, timeout=0.05)
+        # Mutating one caller's response shouldn't affect anyone else's
+        resp1["ops"].append(2)
+        self.assertEqual({"ops": [1]}, await asyncio.wait_for(fut2, timeout=0.05))
+        self.assertEqual({"ops": [1]}, await command_api.get_api("foo"))
+        self.assertEqual(1, len(self.protocol.sent_messages))
+
+    async def test_cached_responses(self):
+        self._write_welcome()
+        await self.client.connect()
+
+        command_api = outleap.CommandAPI(self.client)
+        fut1 = command_api.get_api("foo")
+        fut2 = command_api.get_api("foo")
+        # Only one request should have been made for both calls
+        self.assertEqual(1, len(self.protocol.sent_messages))
+        self._write_reply(1, {"whatever": "foo"})
+        self.assertEqual("foo", (await asyncio.wait_for(fut1, timeout=0.05))["whatever"])
+        self.assertEqual("foo", (await asyncio.wait_for(fut2, timeout=0.05))["whatever"])
+        # Already resolved, shouldn't send anything
+        self.assertEqual("foo", (await command_api.get_api("foo"))["whatever"])
+        self.assertEqual(1, len(self.protocol.sent_messages))
+
+        # Different API, different request
+        command_api.get_api("bar")
+        self.assertEqual("bar", self.protocol.sent_messages[-1]["data"]["api"])
+        self.assertEqual(2, len(self.protocol.sent_messages))
+
+        command_api.clear_cache()
+        command_api.get_api("foo")
+        self.assertEqual(3, len(self.protocol.sent_messages))